@@ -6,20 +6,68 @@ import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from xml.sax.saxutils import escape
 
-import gpxpy
-import gpxpy.gpx
-import requests
+import httpx
+import lxml.html
 import telegram
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from lxml import etree
+from telegram.request import HTTPXRequest
 
 # Constants
 EARTH_RADIUS_KM = 6371.0
+MIN_DESCENT_RATE = 1e-6
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_INV_EARTH_R = 1.0 / EARTH_RADIUS_KM
 GPX_SYMBOL_LAST_SEEN = "transport-airport"
 GPX_SYMBOL_PREDICTED_LANDING = "z-ico01"
 GPX_SYMBOL_RADIOSONDY_LANDING = "z-ico02"
 APRS_DATA_TABLE_ID = "Table7"
+APRS_DATA_CELL_COUNT = 9
+GPX_OUTPUT_DIR = "gpx"
+HTTP_TIMEOUT_S = 10.0
+HTTP_CONNECT_TIMEOUT_S = 3.05
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF_S = 0.5
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+HTTP_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "radiosondy-landed-waypoints",
+}
+APRS_DATA_FIRST_ROW_CELLS_XPATH = etree.XPath(
+    f'//table[@id="{APRS_DATA_TABLE_ID}"]/tbody/tr[1]/td'
+)
+
+_GPX_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1" creator="radiosondy_landed_waypoints">\n'
+    "{waypoints}"
+    "</gpx>\n"
+)
+_WPT_TEMPLATE = (
+    '  <wpt lat="{lat}" lon="{lon}">\n'
+    "    <name>{name}</name>\n"
+    "{desc}"
+    "    <sym>{sym}</sym>\n"
+    "  </wpt>\n"
+)
+_DESC_TEMPLATE = "    <desc>{desc}</desc>\n"
+
+_SONDE_NUMBER_RE = re.compile(r"[?&]sondenumber=([A-Za-z0-9]+)(?=[&#]|$)")
+_COORDS_RE = re.compile(
+    r"^\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)(?:\s+at\s+(.+?))?\s*$"
+)
+_CLIMB_RE = re.compile(r"[-+]?(?:\d*\.\d+|\d+)")
+_GROUND_ALT_RE = re.compile(rb"Ground Altitude:\s*(-?\d+(?:\.\d+)?)\s*m")
+_APRS_ROW_RE = re.compile(
+    rb"<table[^>]*\bid=[\"']?" + re.escape(APRS_DATA_TABLE_ID.encode()) + rb"\b[^>]*>"
+    rb"(?:(?!</table>).)*?<tbody[^>]*>\s*<tr\b[^>]*>(.*?)</tr>",
+    re.DOTALL | re.IGNORECASE,
+)
+_CELL_RE = re.compile(rb"<td\b[^>]*>(.*?)</td>", re.DOTALL | re.IGNORECASE)
+_CELL_OPEN_RE = re.compile(rb"<td\b", re.IGNORECASE)
 
 
 # Configure logging
@@ -29,13 +77,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
+class Config:
+    """Credentials read from the environment once at startup."""
+
+    bot_token: str | None = None
+    chat_id: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        return cls(
+            bot_token=os.getenv("ENV_TELEGRAM_BOT_TOKEN"),
+            chat_id=os.getenv("ENV_TELEGRAM_CHAT_ID"),
+        )
+
+    @property
+    def telegram_enabled(self) -> bool:
+        return bool(self.bot_token and self.chat_id)
+
+
+@dataclass(slots=True, frozen=True)
 class Coordinates:
     lat: float
     lon: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SondeData:
     """Holds the parsed data for a radiosonde."""
 
@@ -47,55 +114,140 @@ class SondeData:
     climb_rate: float
 
 
+def _landing_math(
+    lat: float, lon: float, course_deg: float, distance_km: float
+) -> tuple[float, float]:
+    """Projects a point along a great circle by distance_km on the given course."""
+    lat_rad = lat * _DEG2RAD
+    lon_rad = lon * _DEG2RAD
+    course_rad = course_deg * _DEG2RAD
+
+    ang = distance_km * _INV_EARTH_R
+    sin_ang, cos_ang = math.sin(ang), math.cos(ang)
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+    sin_crs, cos_crs = math.sin(course_rad), math.cos(course_rad)
+
+    sin_new_lat = sin_lat * cos_ang + cos_lat * sin_ang * cos_crs
+    new_lat_rad = math.asin(sin_new_lat)
+    new_lon_rad = lon_rad + math.atan2(
+        sin_crs * sin_ang * cos_lat, cos_ang - sin_lat * sin_new_lat
+    )
+
+    return new_lat_rad * _RAD2DEG, new_lon_rad * _RAD2DEG
+
+
+def _format_coordinate(value: float) -> str:
+    """Formats a coordinate as a plain decimal; GPX does not allow exponents."""
+    text = f"{value:.10f}".rstrip("0")
+    return text + "0" if text.endswith(".") else text
+
+
+def _gpx_waypoint(
+    coords: Coordinates, name: str, symbol: str, description: str | None = None
+) -> str:
+    """Renders a single GPX waypoint element."""
+    return _WPT_TEMPLATE.format(
+        lat=_format_coordinate(coords.lat),
+        lon=_format_coordinate(coords.lon),
+        name=escape(name),
+        desc=_DESC_TEMPLATE.format(desc=escape(description)) if description else "",
+        sym=escape(symbol),
+    )
+
+
+def _parse_climb_rate(text: str) -> float:
+    """Parses the climb rate cell, falling back to a regex for decorated values."""
+    parts = text.split()
+    try:
+        return float(parts[0])
+    except (IndexError, ValueError):
+        climb_rate_match = _CLIMB_RE.search(text)
+        return float(climb_rate_match.group()) if climb_rate_match else 0.0
+
+
+def _first_row_cells(html_content: bytes) -> list[str]:
+    """Returns the stripped cell texts of the first Table7 row.
+
+    Plain-text cells are cut straight out of the raw bytes with a regex; the
+    page is only parsed with lxml when the row is missing, short, leaves out
+    </td> end tags, or a cell contains markup, entities or non-ASCII text.
+    """
+    row_match = _APRS_ROW_RE.search(html_content)
+    if row_match:
+        row = row_match.group(1)
+        cells = _CELL_RE.findall(row)
+        if (
+            len(cells) >= APRS_DATA_CELL_COUNT
+            and len(cells) == len(_CELL_OPEN_RE.findall(row))
+            and all(cell.isascii() and b"<" not in cell and b"&" not in cell for cell in cells)
+        ):
+            return [cell.decode("ascii").strip() for cell in cells]
+
+    tree = lxml.html.fromstring(html_content)
+    return [cell.text_content().strip() for cell in APRS_DATA_FIRST_ROW_CELLS_XPATH(tree)]
+
+
 class SondeProcessor:
-    def __init__(self, url: str, coords: str | None = None):
+    def __init__(
+        self,
+        url: str,
+        coords: str | None = None,
+        save_gpx: bool = False,
+        config: Config | None = None,
+    ):
         self.url = url
         self.coords = coords
+        self.save_gpx = save_gpx
+        self.config = config or Config()
         self.sonde_number = self._extract_sonde_number(url)
         self.radiosondy_coords = None
         self.radiosondy_coords_description = None
         self._parse_radiosondy_coords()
 
     def _extract_sonde_number(self, url: str) -> str | None:
-        match = re.search(r"sondenumber=([A-Z0-9]+)", url)
+        match = _SONDE_NUMBER_RE.search(url)
         if match:
             return match.group(1)
         logger.warning("Could not extract sonde number from URL.")
         return None
 
     def _parse_radiosondy_coords(self):
-        if self.coords:
-            try:
-                coords_match = re.match(
-                    r"([\d.\-]+),([\d.\-]+)(\s+at\s+(.*))?", self.coords
-                )
-                if coords_match:
-                    lat_str = coords_match.group(1)
-                    lon_str = coords_match.group(2)
-                    self.radiosondy_coords = Coordinates(
-                        lat=float(lat_str), lon=float(lon_str)
-                    )
-                    if coords_match.group(4):
-                        self.radiosondy_coords_description = coords_match.group(4)
-                else:
-                    logger.warning(
-                        "Invalid format for --coords. Please use 'lat,lon' or 'lat,lon at YYYY-MM-DDTHH:MM:SS.ssZ'."
-                    )
-                logger.info(f"radiosondy_coords: {self.radiosondy_coords}")
-            except ValueError:
-                logger.warning(
-                    "Invalid format for --coords. Please use 'lat,lon' or 'lat,lon at YYYY-MM-DDTHH:MM:SS.ssZ'."
-                )
+        if not self.coords:
+            return
 
-    def fetch_website_content(self) -> str | None:
-        """Fetches the HTML content of a given URL."""
-        try:
-            response = requests.get(self.url)
-            response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching website content: {e}")
-            return None
+        coords_match = _COORDS_RE.match(self.coords)
+        if not coords_match:
+            logger.warning(
+                "Invalid format for --coords. Please use 'lat,lon' or 'lat,lon at YYYY-MM-DDTHH:MM:SS.ssZ'."
+            )
+            return
+
+        self.radiosondy_coords = Coordinates(
+            lat=float(coords_match.group(1)), lon=float(coords_match.group(2))
+        )
+        self.radiosondy_coords_description = coords_match.group(3)
+        logger.info("radiosondy_coords: %s", self.radiosondy_coords)
+
+    async def fetch_website_content(self, client: httpx.AsyncClient) -> bytes | None:
+        """Fetches the raw HTML content of a given URL using the shared HTTP client.
+
+        Failures to connect are retried with exponential backoff; any other
+        HTTP error gives up straight away.
+        """
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                response = await client.get(self.url)
+                response.raise_for_status()
+                return response.content
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if attempt == HTTP_RETRIES:
+                    logger.error("Error fetching website content: %s", e)
+                    return None
+                logger.warning("Connecting to %s failed, retrying: %s", self.url, e)
+                await asyncio.sleep(HTTP_RETRY_BACKOFF_S * 2**attempt)
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                logger.error("Error fetching website content: %s", e)
+                return None
 
     def calculate_landing_point(
         self,
@@ -107,112 +259,99 @@ class SondeProcessor:
         ground_height: float,
     ) -> tuple[Coordinates, float]:
         """Calculates the predicted landing point based on last known position, altitude, speed, and course."""
+        if descent_rate <= 0.0:
+            # A sonde that is not descending never lands; keep it where it is.
+            return coords, math.inf
+
         height_to_descend = altitude - ground_height
         if height_to_descend < 0:
             height_to_descend = 0
 
-        logger.info("Calculating landing point with:")
-        logger.info(f"  - Altitude: {altitude} m")
-        logger.info(f"  - Ground Height: {ground_height} m")
-        logger.info(f"  - Height to Descend: {height_to_descend} m")
-        logger.info(f"  - Speed: {speed} m/s")
-        logger.info(f"  - Course: {course} degrees")
-        logger.info(f"  - Descent Rate: {descent_rate} m/s")
-
         time_to_ground = height_to_descend / descent_rate
-        logger.info(f"  - Time to Ground: {time_to_ground} s")
-
         distance_km = (speed * time_to_ground) / 1000.0
-        logger.info(f"  - Distance: {distance_km} km")
-
-        lat_rad = math.radians(coords.lat)
-        lon_rad = math.radians(coords.lon)
-        course_rad = math.radians(course)
 
-        new_lat_rad = math.asin(
-            math.sin(lat_rad) * math.cos(distance_km / EARTH_RADIUS_KM)
-            + math.cos(lat_rad)
-            * math.sin(distance_km / EARTH_RADIUS_KM)
-            * math.cos(course_rad)
-        )
-        new_lon_rad = lon_rad + math.atan2(
-            math.sin(course_rad)
-            * math.sin(distance_km / EARTH_RADIUS_KM)
-            * math.cos(lat_rad),
-            math.cos(distance_km / EARTH_RADIUS_KM)
-            - math.sin(lat_rad) * math.sin(new_lat_rad),
+        logger.info(
+            "%s landing calc: alt=%s m ground=%s m h2d=%s m speed=%s m/s "
+            "course=%s deg descent=%s m/s t2g=%s s dist=%s km",
+            self.sonde_number,
+            altitude,
+            ground_height,
+            height_to_descend,
+            speed,
+            course,
+            descent_rate,
+            time_to_ground,
+            distance_km,
         )
 
-        new_lat = math.degrees(new_lat_rad)
-        new_lon = math.degrees(new_lon_rad)
+        new_lat, new_lon = _landing_math(coords.lat, coords.lon, course, distance_km)
 
         return Coordinates(lat=new_lat, lon=new_lon), time_to_ground
 
-    def parse_last_seen_data(self, soup) -> SondeData | None:
+    def parse_last_seen_data(self, html_content: bytes) -> SondeData | None:
         """Parses the HTML to find the last seen coordinates, time, course, altitude and speed."""
         try:
-            aprs_data_table = soup.find("table", id=APRS_DATA_TABLE_ID)
-            first_row = aprs_data_table.find("tbody").find("tr")
-            cells = first_row.find_all("td")
-            last_seen_time_str = cells[2].text
-            lat_str = cells[3].text
-            lon_str = cells[4].text
-            course = cells[5].text
-            speed_kmh = cells[6].text
-            altitude = cells[7].text
-            climb_rate_str = cells[8].text
-
-            climb_rate_match = re.search(r"[-+]?\d*\.\d+|\d+", climb_rate_str)
-            climb_rate = float(climb_rate_match.group()) if climb_rate_match else 0.0
+            cells = _first_row_cells(html_content)
+            last_seen_time_str = cells[2]
+            lat_str = cells[3]
+            lon_str = cells[4]
+            course = cells[5]
+            speed_kmh = cells[6]
+            altitude = cells[7]
+            climb_rate = _parse_climb_rate(cells[8])
 
             speed_mps = float(speed_kmh) * 1000 / 3600
 
-            last_seen_time = datetime.strptime(last_seen_time_str, "%Y-%m-%d %H:%M:%S")
-            logger.info(f"last_seen: ({float(lat_str)}, {float(lon_str)})")
+            last_seen_time = datetime.fromisoformat(last_seen_time_str)
+            last_seen_coords = Coordinates(lat=float(lat_str), lon=float(lon_str))
+            logger.info("last_seen: %s", last_seen_coords)
             return SondeData(
-                last_seen_coords=Coordinates(lat=float(lat_str), lon=float(lon_str)),
+                last_seen_coords=last_seen_coords,
                 last_seen_time=last_seen_time,
                 course=float(course),
                 altitude=float(altitude),
                 speed_mps=speed_mps,
                 climb_rate=climb_rate,
             )
-        except (AttributeError, IndexError, ValueError) as e:
-            logger.error(f"Could not parse last seen data: {e}")
+        except (etree.ParserError, IndexError, ValueError) as e:
+            logger.error("Could not parse last seen data: %s", e)
             return None
 
+    def _parse_page(self, html_content: bytes) -> tuple[SondeData | None, float]:
+        """Extracts the sonde data and ground height from the undecoded page bytes."""
+        ground_height = 0.0
+        ground_altitude_match = _GROUND_ALT_RE.search(html_content)
+        if ground_altitude_match:
+            ground_height = float(ground_altitude_match.group(1))
+
+        return self.parse_last_seen_data(html_content), ground_height
+
     def get_coordinates(
-        self, html_content: str
+        self, html_content: bytes
     ) -> tuple[SondeData | None, Coordinates | None, float, float]:
         """Parses HTML content to extract sonde data and calculate landing coordinates."""
-        soup = BeautifulSoup(html_content, "html.parser")
-        landing_point = None
-        ground_height = 0.0
-        time_to_ground = 0.0
-
-        try:
-            ground_altitude_match = re.search(r"Ground Altitude: (\d+) m", html_content)
-            if ground_altitude_match:
-                ground_height = float(ground_altitude_match.group(1))
-        except (AttributeError, IndexError, ValueError) as e:
-            logger.error(f"Could not parse ground height: {e}")
-
-        sonde_data = self.parse_last_seen_data(soup)
-
-        if sonde_data:
-            descent_rate = abs(sonde_data.climb_rate)
-            if descent_rate > 0:
-                landing_point_coords, time_to_ground = self.calculate_landing_point(
-                    sonde_data.last_seen_coords,
-                    sonde_data.altitude,
-                    sonde_data.speed_mps,
-                    sonde_data.course,
-                    descent_rate,
-                    ground_height,
-                )
-                landing_point = landing_point_coords
+        sonde_data, ground_height = self._parse_page(html_content)
+        if not sonde_data:
+            return None, None, ground_height, 0.0
+
+        descent_rate = abs(sonde_data.climb_rate)
+        if descent_rate < MIN_DESCENT_RATE or sonde_data.altitude <= ground_height:
+            # Already on the ground: the last seen position is the landing point
+            logger.info(
+                "%s has landed at %s", self.sonde_number, sonde_data.last_seen_coords
+            )
+            return sonde_data, sonde_data.last_seen_coords, ground_height, 0.0
+
+        landing_point, time_to_ground = self.calculate_landing_point(
+            sonde_data.last_seen_coords,
+            sonde_data.altitude,
+            sonde_data.speed_mps,
+            sonde_data.course,
+            descent_rate,
+            ground_height,
+        )
 
-        logger.info(f"landing_point: {landing_point}")
+        logger.info("landing_point: %s", landing_point)
 
         return sonde_data, landing_point, ground_height, time_to_ground
 
@@ -222,103 +361,213 @@ class SondeProcessor:
         landing_point: Coordinates,
         ground_height: float,
         time_to_ground: float,
-    ) -> str | None:
-        """Creates a GPX file with waypoints for the last seen and landing point."""
-
-        gpx = gpxpy.gpx.GPX()
-
-        time_str = sonde_data.last_seen_time.strftime("%y%m%d_%H%M")
+    ) -> tuple[str, bytes]:
+        """Creates the GPX document with waypoints for the last seen and landing point.
+
+        Returns the file name and the encoded document.
+        """
+
+        t = sonde_data.last_seen_time
+        time_str = f"{t.year % 100:02d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}"
+
+        waypoints = [
+            _gpx_waypoint(
+                sonde_data.last_seen_coords,
+                f"{self.sonde_number} Last Seen",
+                GPX_SYMBOL_LAST_SEEN,
+                f"Course: {sonde_data.course}, Speed {sonde_data.speed_mps}, Altitude: {sonde_data.altitude}, GroundHeight: {ground_height}",
+            ),
+            _gpx_waypoint(
+                landing_point,
+                f"{self.sonde_number} Predicted Landing",
+                GPX_SYMBOL_PREDICTED_LANDING,
+                f"Time2Ground: {time_to_ground}, GroundHeight: {ground_height}, LandingTime: {time_str}",
+            ),
+        ]
 
-        last_seen_waypoint = gpxpy.gpx.GPXWaypoint()
-        last_seen_waypoint.latitude = sonde_data.last_seen_coords.lat
-        last_seen_waypoint.longitude = sonde_data.last_seen_coords.lon
-        last_seen_waypoint.name = f"{self.sonde_number} Last Seen"
-        last_seen_waypoint.description = f"Course: {sonde_data.course}, Speed {sonde_data.speed_mps}, Altitude: {sonde_data.altitude}, GroundHeight: {ground_height}"
-        last_seen_waypoint.symbol = GPX_SYMBOL_LAST_SEEN
-        gpx.waypoints.append(last_seen_waypoint)
+        if self.radiosondy_coords:
+            waypoints.append(
+                _gpx_waypoint(
+                    self.radiosondy_coords,
+                    f"{self.sonde_number} radiosondy Landing Point",
+                    GPX_SYMBOL_RADIOSONDY_LANDING,
+                    self.radiosondy_coords_description,
+                )
+            )
+            logger.info("radiosondy_coords: %s", self.radiosondy_coords)
 
-        landing_point_waypoint = gpxpy.gpx.GPXWaypoint()
-        landing_point_waypoint.latitude = landing_point.lat
-        landing_point_waypoint.longitude = landing_point.lon
-        landing_point_waypoint.name = f"{self.sonde_number} Predicted Landing"
-        landing_point_waypoint.description = f"Time2Ground: {time_to_ground}, GroundHeight: {ground_height}, LandingTime: {time_str}"
-        landing_point_waypoint.symbol = GPX_SYMBOL_PREDICTED_LANDING
-        gpx.waypoints.append(landing_point_waypoint)
+        filename = f"{self.sonde_number}_{time_str}_gpx_waypoint.gpx"
+        payload = _GPX_TEMPLATE.format(waypoints="".join(waypoints)).encode("utf-8")
 
-        if self.radiosondy_coords:
-            radiosondy_waypoint = gpxpy.gpx.GPXWaypoint()
-            radiosondy_waypoint.latitude = self.radiosondy_coords.lat
-            radiosondy_waypoint.longitude = self.radiosondy_coords.lon
-            radiosondy_waypoint.name = f"{self.sonde_number} radiosondy Landing Point"
-            if self.radiosondy_coords_description:
-                radiosondy_waypoint.description = self.radiosondy_coords_description
-            radiosondy_waypoint.symbol = GPX_SYMBOL_RADIOSONDY_LANDING
-            gpx.waypoints.append(radiosondy_waypoint)
-            logger.info(f"radiosondy_coords: {self.radiosondy_coords}")
+        return filename, payload
 
+    def write_gpx_file(self, filename: str, payload: bytes) -> str | None:
+        """Writes the GPX document to the gpx/ directory and returns its path."""
+        file_path = os.path.join(GPX_OUTPUT_DIR, filename)
         try:
-            filename = f"gpx/{self.sonde_number}_{time_str}_gpx_waypoint.gpx"
-            with open(filename, "w") as f:
-                f.write(gpx.to_xml())
-            logger.info(f"Successfully created {filename}")
-            return filename
-        except IOError as e:
-            logger.error(f"Error writing GPX file: {e}")
+            with open(file_path, "wb") as f:
+                f.write(payload)
+            logger.info("Successfully created %s", file_path)
+            return file_path
+        except OSError as e:
+            logger.error("Error writing GPX file: %s", e)
             return None
 
-    async def send_to_telegram(self, file_path: str):
-        """Sends the GPX file to a Telegram chat."""
-        bot_token = os.getenv("ENV_TELEGRAM_BOT_TOKEN")
-        chat_id = os.getenv("ENV_TELEGRAM_CHAT_ID")
-
-        if not bot_token or not chat_id:
-            logger.warning("Telegram bot token or chat ID not found in .env file.")
+    async def send_to_telegram(
+        self, bot: telegram.Bot | None, filename: str, payload: bytes
+    ):
+        """Sends the GPX document to a Telegram chat straight from memory using the shared bot."""
+        if not bot or not self.config.chat_id:
             return
 
         try:
-            bot = telegram.Bot(token=bot_token)
-            with open(file_path, "rb") as f:
-                logger.info(f"Trying to send {file_path} to Telegram")
-                await bot.send_document(chat_id=chat_id, document=f)
-            logger.info(f"Successfully sent {file_path} to Telegram.")
+            logger.info("Trying to send %s to Telegram", filename)
+            await bot.send_document(
+                chat_id=self.config.chat_id,
+                document=telegram.InputFile(payload, filename=filename),
+            )
+            logger.info("Successfully sent %s to Telegram.", filename)
         except Exception as e:
-            logger.error(f"Error sending file to Telegram: {e}")
+            logger.error("Error sending file to Telegram: %s", e)
+
+    async def run(
+        self, client: httpx.AsyncClient, bot: telegram.Bot | None = None
+    ) -> str | None:
+        """Fetches, parses and builds the GPX file for this sonde, then sends it to Telegram."""
+        html_content = await self.fetch_website_content(client)
+        if not html_content:
+            return None
+
+        sonde_data, landing_point, ground_height, time_to_ground = (
+            self.get_coordinates(html_content)
+        )
+        if not sonde_data or not landing_point:
+            return None
+
+        filename, payload = self.create_gpx_file(
+            sonde_data, landing_point, ground_height, time_to_ground
+        )
+        if self.save_gpx:
+            # Keep the blocking disk write off the event loop
+            file_path = await asyncio.to_thread(self.write_gpx_file, filename, payload)
+            if not file_path:
+                return None
+
+        await self.send_to_telegram(bot, filename, payload)
+        return filename
+
+
+def create_telegram_bot(token: str) -> telegram.Bot:
+    """Creates the telegram.Bot shared by all processors in a run."""
+    return telegram.Bot(token=token, request=HTTPXRequest(http_version="2"))
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Creates the pooled HTTP client shared by all processors in a run.
+
+    No custom transport is passed, so httpx keeps honouring HTTP(S)_PROXY and
+    NO_PROXY from the environment.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=HTTP_LIMITS,
+        timeout=httpx.Timeout(HTTP_TIMEOUT_S, connect=HTTP_CONNECT_TIMEOUT_S),
+        headers=HTTP_HEADERS,
+    )
+
+
+def read_urls_file(path: str) -> list[str]:
+    """Reads one URL per line, skipping blank lines and '#' comments."""
+    with open(path) as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
 
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
         description="Generate a GPX waypoint file from a radiosonde tracking website."
     )
-    parser.add_argument("url", help="The URL of the radiosonde tracking website.")
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        metavar="url",
+        help="One or more URLs of the radiosonde tracking website.",
+    )
+    parser.add_argument(
+        "--urls-file",
+        help="File with one URL per line to process in the same run (blank lines and '#' comments are ignored).",
+    )
     parser.add_argument(
         "--coords",
-        help="Optional coordinates in format 'lat,lon' to add as a waypoint.",
+        help="Optional coordinates in format 'lat,lon' to add as a waypoint (only with a single URL).",
+    )
+    parser.add_argument(
+        "--save-gpx",
+        action="store_true",
+        help=f"Also write the generated GPX files to the '{GPX_OUTPUT_DIR}/' directory.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.urls_file:
+        try:
+            args.urls = args.urls + read_urls_file(args.urls_file)
+        except OSError as e:
+            parser.error(f"Could not read --urls-file: {e}")
+    if not args.urls:
+        parser.error("at least one url or --urls-file is required")
+    if args.coords and len(args.urls) > 1:
+        parser.error("--coords can only be used with a single URL")
+    return args
 
 
 async def main():
     """Main function to orchestrate the script execution."""
     load_dotenv()
+    config = Config.from_env()
     args = parse_arguments()
 
-    processor = SondeProcessor(args.url, args.coords)
+    if not config.telegram_enabled:
+        logger.warning("Telegram bot token or chat ID not found in .env file.")
+
+    if args.save_gpx:
+        os.makedirs(GPX_OUTPUT_DIR, exist_ok=True)
 
-    if not processor.sonde_number:
+    processors = [
+        SondeProcessor(url, args.coords, args.save_gpx, config) for url in args.urls
+    ]
+    processors = [processor for processor in processors if processor.sonde_number]
+    if not processors:
         return
 
-    html_content = processor.fetch_website_content()
-    if html_content:
-        sonde_data, landing_point, ground_height, time_to_ground = (
-            processor.get_coordinates(html_content)
-        )
-        if sonde_data and landing_point:
-            filename = processor.create_gpx_file(
-                sonde_data, landing_point, ground_height, time_to_ground
+    bot = None
+    if config.telegram_enabled:
+        bot = create_telegram_bot(config.bot_token)
+        try:
+            await bot.initialize()
+        except telegram.error.TelegramError as e:
+            # Telegram being unreachable must not stop the GPX files from being built
+            logger.error("Could not start the Telegram bot, continuing without it: %s", e)
+            bot = None
+
+    try:
+        # One failing sonde must not take the others down with it
+        async with create_http_client() as client:
+            results = await asyncio.gather(
+                *(processor.run(client, bot) for processor in processors),
+                return_exceptions=True,
             )
-            if filename:
-                await processor.send_to_telegram(filename)
+        for processor, result in zip(processors, results):
+            if isinstance(result, Exception):
+                logger.error("Processing %s failed: %s", processor.url, result)
+    finally:
+        if bot:
+            await bot.shutdown()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,16 +1,37 @@
 import argparse
+import math
 import os
-import requests
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import lxml.html
 import pytest
-
-from main import Coordinates, SondeData, SondeProcessor, parse_arguments
+import telegram
+from lxml import etree
+from telegram.request import HTTPXRequest
+
+from main import (
+    EARTH_RADIUS_KM,
+    HTTP_RETRIES,
+    Config,
+    Coordinates,
+    SondeData,
+    SondeProcessor,
+    _first_row_cells,
+    _landing_math,
+    _parse_climb_rate,
+    create_http_client,
+    create_telegram_bot,
+    parse_arguments,
+)
 
 # Mock data for testing
 MOCK_URL = "http://example.com/track.php?sondenumber=S123456"
-MOCK_HTML_CONTENT = """
+MOCK_URL_2 = "http://example.com/track.php?sondenumber=S654321"
+MOCK_CONFIG = Config(bot_token="test_token", chat_id="12345")
+GPX_NS = "http://www.topografix.com/GPX/1/1"
+MOCK_HTML_CONTENT = b"""
 <html>
 <body>
     <table id="Table7">
@@ -32,7 +53,7 @@ MOCK_HTML_CONTENT = """
 </body>
 </html>
 """
-MOCK_HTML_CONTENT_NO_GROUND_ALT = """
+MOCK_HTML_CONTENT_NO_GROUND_ALT = b"""
 <html>
 <body>
     <table id="Table7">
@@ -53,7 +74,7 @@ MOCK_HTML_CONTENT_NO_GROUND_ALT = """
 </body>
 </html>
 """
-MOCK_HTML_CONTENT_MISSING_DATA = """
+MOCK_HTML_CONTENT_MISSING_DATA = b"""
 <html>
 <body>
     <table id="Table7">
@@ -72,6 +93,13 @@ MOCK_HTML_CONTENT_MISSING_DATA = """
 """
 
 
+@pytest.fixture
+def mock_bot_class():
+    with patch("telegram.Bot") as bot_class:
+        bot_class.return_value = AsyncMock()
+        yield bot_class
+
+
 @pytest.fixture
 def mock_env_vars():
     with patch.dict(os.environ, {"ENV_TELEGRAM_BOT_TOKEN": "test_token", "ENV_TELEGRAM_CHAT_ID": "12345"}):
@@ -80,32 +108,74 @@ def mock_env_vars():
 
 # Tests for parse_arguments
 def test_parse_arguments_valid_url():
-    with patch("argparse.ArgumentParser.parse_args", return_value=argparse.Namespace(url=MOCK_URL, coords=None)):
+    with patch("argparse.ArgumentParser.parse_args", return_value=argparse.Namespace(urls=[MOCK_URL], urls_file=None, coords=None, save_gpx=False)):
         args = parse_arguments()
-        assert args.url == MOCK_URL
+        assert args.urls == [MOCK_URL]
         assert args.coords is None
 
 
 def test_parse_arguments_valid_url_and_coords():
     with patch(
         "argparse.ArgumentParser.parse_args",
-        return_value=argparse.Namespace(url=MOCK_URL, coords="51.0,11.0"),
+        return_value=argparse.Namespace(urls=[MOCK_URL], urls_file=None, coords="51.0,11.0", save_gpx=False),
     ):
         args = parse_arguments()
-        assert args.url == MOCK_URL
+        assert args.urls == [MOCK_URL]
         assert args.coords == "51.0,11.0"
 
 
 def test_parse_arguments_valid_url_and_coords_with_description():
     with patch(
         "argparse.ArgumentParser.parse_args",
-        return_value=argparse.Namespace(url=MOCK_URL, coords="51.0,11.0 at 2023-10-27T10:00:00.00Z"),
+        return_value=argparse.Namespace(
+            urls=[MOCK_URL], urls_file=None, coords="51.0,11.0 at 2023-10-27T10:00:00.00Z", save_gpx=False
+        ),
     ):
         args = parse_arguments()
-        assert args.url == MOCK_URL
+        assert args.urls == [MOCK_URL]
         assert args.coords == "51.0,11.0 at 2023-10-27T10:00:00.00Z"
 
 
+def test_parse_arguments_multiple_urls():
+    with patch("sys.argv", ["main.py", MOCK_URL, MOCK_URL_2]):
+        args = parse_arguments()
+        assert args.urls == [MOCK_URL, MOCK_URL_2]
+        assert args.coords is None
+        assert args.save_gpx is False
+
+
+def test_parse_arguments_save_gpx():
+    with patch("sys.argv", ["main.py", MOCK_URL, "--save-gpx"]):
+        args = parse_arguments()
+        assert args.urls == [MOCK_URL]
+        assert args.save_gpx is True
+
+
+def test_parse_arguments_urls_file(tmp_path):
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text(f"# tracked sondes\n{MOCK_URL_2}\n\n  {MOCK_URL_2.replace('S654321', 'S111111')}  \n")
+
+    with patch("sys.argv", ["main.py", MOCK_URL, "--urls-file", str(urls_file)]):
+        args = parse_arguments()
+
+    assert args.urls == [MOCK_URL, MOCK_URL_2, MOCK_URL_2.replace("S654321", "S111111")]
+
+
+def test_parse_arguments_urls_file_missing(tmp_path):
+    with patch("sys.argv", ["main.py", "--urls-file", str(tmp_path / "missing.txt")]), pytest.raises(SystemExit):
+        parse_arguments()
+
+
+def test_parse_arguments_no_urls():
+    with patch("sys.argv", ["main.py"]), pytest.raises(SystemExit):
+        parse_arguments()
+
+
+def test_parse_arguments_coords_with_multiple_urls():
+    with patch("sys.argv", ["main.py", MOCK_URL, MOCK_URL_2, "--coords", "51.0,11.0"]), pytest.raises(SystemExit):
+        parse_arguments()
+
+
 # Tests for SondeProcessor.__init__
 def test_sonde_processor_init_valid_url():
     processor = SondeProcessor(MOCK_URL)
@@ -114,6 +184,25 @@ def test_sonde_processor_init_valid_url():
     assert processor.radiosondy_coords is None
 
 
+def test_sonde_processor_init_sonde_number_followed_by_params():
+    processor = SondeProcessor("http://example.com/track.php?sondenumber=S123456&lang=en#map")
+    assert processor.sonde_number == "S123456"
+
+
+def test_sonde_processor_init_rejects_path_in_sonde_number():
+    # The sonde number ends up in the GPX filename, so it must not carry path segments
+    for url in (
+        "http://example.com/track.php?sondenumber=../../tmp/evil",
+        "http://example.com/track.php?sondenumber=S123456/../evil",
+    ):
+        assert SondeProcessor(url).sonde_number is None
+
+
+def test_sonde_processor_init_no_sonde_number():
+    processor = SondeProcessor("http://example.com/track.php?othersondenumber=S123456")
+    assert processor.sonde_number is None
+
+
 def test_sonde_processor_init_valid_url_and_coords():
     processor = SondeProcessor(MOCK_URL, coords="51.0,11.0")
     assert processor.url == MOCK_URL
@@ -135,47 +224,104 @@ def test_sonde_processor_init_invalid_coords_format():
     assert processor.radiosondy_coords is None
 
 
+def test_sonde_processor_init_malformed_number_coords():
+    processor = SondeProcessor(MOCK_URL, coords="51.0.1,11.0")
+    assert processor.radiosondy_coords is None
+
+
+def test_sonde_processor_init_coords_with_spaces_and_negative_values():
+    processor = SondeProcessor(MOCK_URL, coords=" -51.5 , -11 at 2023-10-27T10:00:00.00Z ")
+    assert processor.radiosondy_coords == Coordinates(lat=-51.5, lon=-11.0)
+    assert processor.radiosondy_coords_description == "2023-10-27T10:00:00.00Z"
+
+
 # Tests for fetch_website_content
-@patch("requests.get")
-def test_fetch_website_content_success(mock_get):
+@pytest.mark.asyncio
+async def test_fetch_website_content_success():
     mock_response = MagicMock()
-    mock_response.text = MOCK_HTML_CONTENT
+    mock_response.content = MOCK_HTML_CONTENT
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
 
     processor = SondeProcessor(MOCK_URL)
-    content = processor.fetch_website_content()
+    content = await processor.fetch_website_content(mock_client)
     assert content == MOCK_HTML_CONTENT
-    mock_get.assert_called_once_with(MOCK_URL)
+    mock_client.get.assert_called_once_with(MOCK_URL)
+
+
+@pytest.mark.asyncio
+async def test_fetch_website_content_http_error():
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=httpx.HTTPError("HTTP Error"))
+
+    processor = SondeProcessor(MOCK_URL)
+    content = await processor.fetch_website_content(mock_client)
+    assert content is None
+    mock_client.get.assert_called_once_with(MOCK_URL)
 
 
-@patch("requests.get")
-def test_fetch_website_content_http_error(mock_get):
-    mock_get.side_effect = requests.exceptions.RequestException("HTTP Error")
+@pytest.mark.asyncio
+@patch("asyncio.sleep", new_callable=AsyncMock)
+async def test_fetch_website_content_connection_error(mock_sleep):
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection Error"))
 
     processor = SondeProcessor(MOCK_URL)
-    content = processor.fetch_website_content()
+    content = await processor.fetch_website_content(mock_client)
     assert content is None
-    mock_get.assert_called_once_with(MOCK_URL)
+    assert mock_client.get.call_count == HTTP_RETRIES + 1
+    assert mock_sleep.await_count == HTTP_RETRIES
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep", new_callable=AsyncMock)
+async def test_fetch_website_content_retries_connection_error(mock_sleep):
+    mock_response = MagicMock()
+    mock_response.content = MOCK_HTML_CONTENT
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=[httpx.ConnectTimeout("Timeout"), mock_response])
+
+    processor = SondeProcessor(MOCK_URL)
+    content = await processor.fetch_website_content(mock_client)
+    assert content == MOCK_HTML_CONTENT
+    assert mock_client.get.call_count == 2
+    mock_sleep.assert_awaited_once()
 
 
-@patch("requests.get")
-def test_fetch_website_content_connection_error(mock_get):
-    mock_get.side_effect = requests.exceptions.ConnectionError("Connection Error")
+@pytest.mark.asyncio
+async def test_fetch_website_content_invalid_url():
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=httpx.InvalidURL("Invalid URL"))
 
     processor = SondeProcessor(MOCK_URL)
-    content = processor.fetch_website_content()
+    content = await processor.fetch_website_content(mock_client)
     assert content is None
-    mock_get.assert_called_once_with(MOCK_URL)
+
+
+@pytest.mark.asyncio
+async def test_create_http_client():
+    async with create_http_client() as client:
+        assert client.headers["User-Agent"] == "radiosondy-landed-waypoints"
+        assert client.timeout.connect == 3.05
+        assert client.timeout.read == 10.0
+
+
+@patch("httpx.AsyncClient")
+def test_create_http_client_honours_env_proxies(mock_client_class):
+    # httpx only reads HTTP(S)_PROXY/NO_PROXY when no custom transport is given
+    create_http_client()
+
+    kwargs = mock_client_class.call_args.kwargs
+    assert "transport" not in kwargs
+    assert kwargs.get("trust_env", True)
+    assert kwargs["http2"] is True
 
 
 # Tests for parse_last_seen_data
 def test_parse_last_seen_data_success():
     processor = SondeProcessor(MOCK_URL)
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(MOCK_HTML_CONTENT, "html.parser")
-    sonde_data = processor.parse_last_seen_data(soup)
+    sonde_data = processor.parse_last_seen_data(MOCK_HTML_CONTENT)
 
     assert sonde_data is not None
     assert sonde_data.last_seen_coords == Coordinates(lat=50.0, lon=10.0)
@@ -188,19 +334,88 @@ def test_parse_last_seen_data_success():
 
 def test_parse_last_seen_data_missing_data():
     processor = SondeProcessor(MOCK_URL)
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(MOCK_HTML_CONTENT_MISSING_DATA, "html.parser")
-    sonde_data = processor.parse_last_seen_data(soup)
+    sonde_data = processor.parse_last_seen_data(MOCK_HTML_CONTENT_MISSING_DATA)
     assert sonde_data is None
 
 
 def test_parse_last_seen_data_invalid_html():
     processor = SondeProcessor(MOCK_URL)
-    from bs4 import BeautifulSoup
+    sonde_data = processor.parse_last_seen_data(b"<div>Invalid HTML</div>")
+    assert sonde_data is None
 
-    soup = BeautifulSoup("<div>Invalid HTML</div>", "html.parser")
-    sonde_data = processor.parse_last_seen_data(soup)
+
+def test_parse_last_seen_data_padded_cells():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(
+        b"<td>2023-10-27 10:00:00</td>", b"<td>\n  2023-10-27 10:00:00  </td>"
+    ).replace(b"<td>-5.0</td>", b"<td> -5.0 m/s </td>")
+    sonde_data = processor.parse_last_seen_data(html_content)
+
+    assert sonde_data is not None
+    assert sonde_data.last_seen_time == datetime(2023, 10, 27, 10, 0, 0)
+    assert sonde_data.climb_rate == -5.0
+
+
+def test_parse_last_seen_data_invalid_time():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(b"2023-10-27 10:00:00", b"27.10.2023 10:00")
+    sonde_data = processor.parse_last_seen_data(html_content)
+    assert sonde_data is None
+
+
+def test_first_row_cells_regex_fast_path():
+    with patch("lxml.html.fromstring") as mock_fromstring:
+        cells = _first_row_cells(MOCK_HTML_CONTENT)
+
+    mock_fromstring.assert_not_called()
+    assert cells == ["1", "2", "2023-10-27 10:00:00", "50.00", "10.00", "90.0", "100.0", "10000.0", "-5.0"]
+
+
+def test_first_row_cells_falls_back_to_lxml_for_markup():
+    html_content = MOCK_HTML_CONTENT.replace(b"<td>50.00</td>", b"<td><b>50.00</b></td>").replace(
+        b"<td>-5.0</td>", b"<td>-5.0&nbsp;m/s</td>"
+    )
+
+    with patch("lxml.html.fromstring", wraps=lxml.html.fromstring) as mock_fromstring:
+        cells = _first_row_cells(html_content)
+
+    mock_fromstring.assert_called_once()
+    assert cells[3] == "50.00"
+    assert cells[8] == "-5.0\xa0m/s"
+
+
+def test_first_row_cells_falls_back_to_lxml_without_end_tags():
+    # HTML allows </td> to be omitted; the regex cannot split such a row
+    for html_content in (
+        MOCK_HTML_CONTENT.replace(b"</td>", b""),
+        MOCK_HTML_CONTENT.replace(b"<td>-5.0</td>", b"<td>-5.0"),
+    ):
+        with patch("lxml.html.fromstring", wraps=lxml.html.fromstring) as mock_fromstring:
+            cells = _first_row_cells(html_content)
+
+        mock_fromstring.assert_called_once()
+        assert cells == ["1", "2", "2023-10-27 10:00:00", "50.00", "10.00", "90.0", "100.0", "10000.0", "-5.0"]
+
+
+def test_first_row_cells_does_not_read_other_tables():
+    html_content = (
+        b'<table id="Table7"><tr><td>no tbody</td></tr></table>'
+        b'<table id="Table8"><tbody><tr><td>wrong</td></tr></tbody></table>'
+    )
+
+    assert _first_row_cells(html_content) == []
+
+
+def test_parse_climb_rate():
+    assert _parse_climb_rate("-5.0") == -5.0
+    assert _parse_climb_rate(" -5.0 m/s ") == -5.0
+    assert _parse_climb_rate("-5m/s") == -5.0
+    assert _parse_climb_rate("") == 0.0
+
+
+def test_parse_last_seen_data_empty_document():
+    processor = SondeProcessor(MOCK_URL)
+    sonde_data = processor.parse_last_seen_data(b"")
     assert sonde_data is None
 
 
@@ -250,9 +465,28 @@ def test_calculate_landing_point_zero_descent_rate():
     descent_rate = 0.0
     ground_height = 100.0
 
-    # Expect division by zero, which should be handled by the caller or result in specific behavior
-    with pytest.raises(ZeroDivisionError):
-        processor.calculate_landing_point(coords, altitude, speed, course, descent_rate, ground_height)
+    landing_coords, time_to_ground = processor.calculate_landing_point(
+        coords, altitude, speed, course, descent_rate, ground_height
+    )
+
+    assert landing_coords == coords
+    assert time_to_ground == math.inf
+
+
+def test_landing_math_due_north():
+    distance_km = EARTH_RADIUS_KM * math.radians(1.0)
+
+    new_lat, new_lon = _landing_math(50.0, 10.0, 0.0, distance_km)
+
+    assert new_lat == pytest.approx(51.0)
+    assert new_lon == pytest.approx(10.0)
+
+
+def test_landing_math_zero_distance():
+    new_lat, new_lon = _landing_math(50.0, 10.0, 90.0, 0.0)
+
+    assert new_lat == pytest.approx(50.0)
+    assert new_lon == pytest.approx(10.0)
 
 
 # Tests for get_coordinates
@@ -276,9 +510,55 @@ def test_get_coordinates_no_ground_altitude():
     assert time_to_ground > 0
 
 
+def test_get_coordinates_landed_sonde_zero_climb_rate():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(b"<td>-5.0</td>", b"<td>0.0</td>")
+
+    with patch.object(SondeProcessor, "calculate_landing_point") as mock_calculate:
+        sonde_data, landing_point, ground_height, time_to_ground = processor.get_coordinates(html_content)
+
+    mock_calculate.assert_not_called()
+    assert landing_point == sonde_data.last_seen_coords
+    assert ground_height == 100.0
+    assert time_to_ground == 0.0
+
+
+def test_get_coordinates_landed_sonde_below_ground_height():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(b"<td>10000.0</td>", b"<td>90.0</td>")
+
+    with patch.object(SondeProcessor, "calculate_landing_point") as mock_calculate:
+        sonde_data, landing_point, _, time_to_ground = processor.get_coordinates(html_content)
+
+    mock_calculate.assert_not_called()
+    assert landing_point == sonde_data.last_seen_coords
+    assert time_to_ground == 0.0
+
+
+def test_get_coordinates_ignores_other_tables():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(
+        b"<body>",
+        b"<body><table id=\"Table1\"><tbody><tr><td>x</td></tr></tbody></table>",
+    )
+    sonde_data, landing_point, _, _ = processor.get_coordinates(html_content)
+
+    assert sonde_data is not None
+    assert sonde_data.last_seen_coords == Coordinates(lat=50.0, lon=10.0)
+    assert landing_point is not None
+
+
+def test_get_coordinates_fractional_ground_altitude():
+    processor = SondeProcessor(MOCK_URL)
+    html_content = MOCK_HTML_CONTENT.replace(b"Ground Altitude: 100 m", b"Ground Altitude:  -2.5m")
+    _, _, ground_height, _ = processor.get_coordinates(html_content)
+
+    assert ground_height == -2.5
+
+
 def test_get_coordinates_parse_last_seen_data_fails():
     processor = SondeProcessor(MOCK_URL)
-    sonde_data, landing_point, ground_height, time_to_ground = processor.get_coordinates("<div>Invalid HTML</div>")
+    sonde_data, landing_point, ground_height, time_to_ground = processor.get_coordinates(b"<div>Invalid HTML</div>")
 
     assert sonde_data is None
     assert landing_point is None
@@ -287,9 +567,8 @@ def test_get_coordinates_parse_last_seen_data_fails():
 
 
 # Tests for create_gpx_file
-@patch("builtins.open", new_callable=mock_open)
-@patch("gpxpy.gpx.GPX.to_xml", return_value="<gpx>test</gpx>")
-def test_create_gpx_file_success(mock_to_xml, mock_file_open):
+def test_create_gpx_file_success(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     processor = SondeProcessor(MOCK_URL)
     sonde_data = SondeData(
         last_seen_coords=Coordinates(lat=50.0, lon=10.0),
@@ -303,16 +582,36 @@ def test_create_gpx_file_success(mock_to_xml, mock_file_open):
     ground_height = 100.0
     time_to_ground = 1000.0
 
-    filename = processor.create_gpx_file(sonde_data, landing_point, ground_height, time_to_ground)
+    filename, payload = processor.create_gpx_file(sonde_data, landing_point, ground_height, time_to_ground)
+
+    assert filename == "S123456_231027_1000_gpx_waypoint.gpx"
+    assert not any(tmp_path.iterdir())
+    waypoints = etree.fromstring(payload).findall(f"{{{GPX_NS}}}wpt")
+    assert len(waypoints) == 2
+    assert waypoints[0].get("lat") == "50.0"
+    assert waypoints[0].get("lon") == "10.0"
+    assert waypoints[0].findtext(f"{{{GPX_NS}}}name") == "S123456 Last Seen"
+    assert waypoints[1].findtext(f"{{{GPX_NS}}}name") == "S123456 Predicted Landing"
+    assert waypoints[1].findtext(f"{{{GPX_NS}}}sym") == "z-ico01"
+
+
+def test_create_gpx_file_pads_time_fields():
+    processor = SondeProcessor(MOCK_URL)
+    sonde_data = SondeData(
+        last_seen_coords=Coordinates(lat=50.0, lon=10.0),
+        last_seen_time=datetime(2005, 1, 2, 3, 4, 5),
+        course=90.0,
+        altitude=10000.0,
+        speed_mps=27.7778,
+        climb_rate=-5.0,
+    )
+
+    filename, _ = processor.create_gpx_file(sonde_data, Coordinates(lat=50.1, lon=10.1), 100.0, 1000.0)
 
-    assert filename == "gpx/S123456_231027_1000_gpx_waypoint.gpx"
-    mock_file_open.assert_called_once_with(filename, "w")
-    mock_file_open().write.assert_called_once_with("<gpx>test</gpx>")
+    assert filename == "S123456_050102_0304_gpx_waypoint.gpx"
 
 
-@patch("builtins.open", new_callable=mock_open)
-@patch("gpxpy.gpx.GPX.to_xml", return_value="<gpx>test</gpx>")
-def test_create_gpx_file_with_radiosondy_coords(mock_to_xml, mock_file_open):
+def test_create_gpx_file_with_radiosondy_coords():
     processor = SondeProcessor(MOCK_URL, coords="51.0,11.0")
     sonde_data = SondeData(
         last_seen_coords=Coordinates(lat=50.0, lon=10.0),
@@ -326,17 +625,38 @@ def test_create_gpx_file_with_radiosondy_coords(mock_to_xml, mock_file_open):
     ground_height = 100.0
     time_to_ground = 1000.0
 
-    filename = processor.create_gpx_file(sonde_data, landing_point, ground_height, time_to_ground)
+    filename, payload = processor.create_gpx_file(sonde_data, landing_point, ground_height, time_to_ground)
 
-    assert filename == "gpx/S123456_231027_1000_gpx_waypoint.gpx"
-    mock_file_open.assert_called_once_with(filename, "w")
-    mock_file_open().write.assert_called_once_with("<gpx>test</gpx>")
-    # Further assertions could check the content of the GPX to ensure radiosondy_coords are included
+    assert filename == "S123456_231027_1000_gpx_waypoint.gpx"
+    waypoints = etree.fromstring(payload).findall(f"{{{GPX_NS}}}wpt")
+    assert len(waypoints) == 3
+    assert waypoints[2].get("lat") == "51.0"
+    assert waypoints[2].get("lon") == "11.0"
+    assert waypoints[2].findtext(f"{{{GPX_NS}}}name") == "S123456 radiosondy Landing Point"
+    assert waypoints[2].find(f"{{{GPX_NS}}}desc") is None
 
 
-@patch("builtins.open", side_effect=IOError("Disk Full"))
-def test_create_gpx_file_io_error(mock_file_open):
+def test_create_gpx_file_near_zero_coordinates():
     processor = SondeProcessor(MOCK_URL)
+    sonde_data = SondeData(
+        last_seen_coords=Coordinates(lat=51.5, lon=0.00005),
+        last_seen_time=datetime(2023, 10, 27, 10, 0, 0),
+        course=90.0,
+        altitude=10000.0,
+        speed_mps=27.7778,
+        climb_rate=-5.0,
+    )
+
+    _, payload = processor.create_gpx_file(sonde_data, Coordinates(lat=-0.00001, lon=0.0), 100.0, 1000.0)
+
+    waypoints = etree.fromstring(payload).findall(f"{{{GPX_NS}}}wpt")
+    assert waypoints[0].get("lon") == "0.00005"
+    assert waypoints[1].get("lat") == "-0.00001"
+    assert waypoints[1].get("lon") == "0.0"
+
+
+def test_create_gpx_file_escapes_description():
+    processor = SondeProcessor(MOCK_URL, coords="51.0,11.0 at <now> & later")
     sonde_data = SondeData(
         last_seen_coords=Coordinates(lat=50.0, lon=10.0),
         last_seen_time=datetime(2023, 10, 27, 10, 0, 0),
@@ -345,65 +665,112 @@ def test_create_gpx_file_io_error(mock_file_open):
         speed_mps=27.7778,
         climb_rate=-5.0,
     )
-    landing_point = Coordinates(lat=50.1, lon=10.1)
-    ground_height = 100.0
-    time_to_ground = 1000.0
 
-    filename = processor.create_gpx_file(sonde_data, landing_point, ground_height, time_to_ground)
+    _, payload = processor.create_gpx_file(sonde_data, Coordinates(lat=50.1, lon=10.1), 100.0, 1000.0)
+
+    waypoints = etree.fromstring(payload).findall(f"{{{GPX_NS}}}wpt")
+    assert waypoints[2].findtext(f"{{{GPX_NS}}}desc") == "<now> & later"
+
+
+# Tests for write_gpx_file
+def test_write_gpx_file_success(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "gpx").mkdir()
+    processor = SondeProcessor(MOCK_URL, save_gpx=True)
+
+    file_path = processor.write_gpx_file("test_file.gpx", b"<gpx>test</gpx>")
 
-    assert filename is None
+    assert file_path == os.path.join("gpx", "test_file.gpx")
+    assert (tmp_path / "gpx" / "test_file.gpx").read_bytes() == b"<gpx>test</gpx>"
+
+
+def test_write_gpx_file_io_error(tmp_path, monkeypatch):
+    # No gpx/ directory exists in tmp_path, so open() fails with an OSError.
+    monkeypatch.chdir(tmp_path)
+    processor = SondeProcessor(MOCK_URL, save_gpx=True)
+
+    file_path = processor.write_gpx_file("test_file.gpx", b"<gpx>test</gpx>")
+
+    assert file_path is None
 
 
 # Tests for send_to_telegram
 @pytest.mark.asyncio
-@patch("telegram.Bot")
-async def test_send_to_telegram_success(mock_bot_class, mock_env_vars):
-    mock_bot_instance = AsyncMock()
-    mock_bot_class.return_value = mock_bot_instance
+async def test_send_to_telegram_success():
+    mock_bot = AsyncMock()
 
-    processor = SondeProcessor(MOCK_URL)
-    test_file_path = "gpx/test_file.gpx"
+    processor = SondeProcessor(MOCK_URL, config=MOCK_CONFIG)
+    test_filename = "test_file.gpx"
 
-    with patch("builtins.open", mock_open(read_data="gpx content")) as mock_file_open:
-        await processor.send_to_telegram(test_file_path)
-        mock_bot_class.assert_called_once_with(token="test_token")
-        mock_bot_instance.send_document.assert_called_once()
-        mock_file_open.assert_called_once_with(test_file_path, "rb")
+    await processor.send_to_telegram(mock_bot, test_filename, b"gpx content")
+    mock_bot.send_document.assert_called_once()
+    kwargs = mock_bot.send_document.call_args.kwargs
+    assert kwargs["chat_id"] == "12345"
+    document = kwargs["document"]
+    assert isinstance(document, telegram.InputFile)
+    assert document.filename == test_filename
+    assert document.input_file_content == b"gpx content"
+    # A plain upload, not an attach:// reference meant for media groups
+    assert document.attach_uri is None
 
 
 @pytest.mark.asyncio
-@patch("telegram.Bot")
-async def test_send_to_telegram_missing_env_vars(mock_bot_class):
-    # Clear env vars for this test
-    with patch.dict(os.environ, {}, clear=True):
-        processor = SondeProcessor(MOCK_URL)
-        test_file_path = "gpx/test_file.gpx"
-        await processor.send_to_telegram(test_file_path)
-        mock_bot_class.assert_not_called()
+async def test_send_to_telegram_missing_chat_id():
+    mock_bot = AsyncMock()
+
+    processor = SondeProcessor(MOCK_URL, config=Config(bot_token="test_token"))
+    await processor.send_to_telegram(mock_bot, "test_file.gpx", b"gpx content")
+    mock_bot.send_document.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_to_telegram_no_bot():
+    processor = SondeProcessor(MOCK_URL, config=MOCK_CONFIG)
+    # Must not raise when no bot could be created
+    await processor.send_to_telegram(None, "test_file.gpx", b"gpx content")
 
 
 @pytest.mark.asyncio
+async def test_send_to_telegram_send_document_fails():
+    mock_bot = AsyncMock()
+    mock_bot.send_document.side_effect = Exception("Telegram Error")
+
+    processor = SondeProcessor(MOCK_URL, config=MOCK_CONFIG)
+
+    await processor.send_to_telegram(mock_bot, "test_file.gpx", b"gpx content")
+    mock_bot.send_document.assert_called_once()
+
+
+# Tests for create_telegram_bot
 @patch("telegram.Bot")
-async def test_send_to_telegram_send_document_fails(mock_bot_class, mock_env_vars):
-    mock_bot_instance = AsyncMock()
-    mock_bot_instance.send_document.side_effect = Exception("Telegram Error")
-    mock_bot_class.return_value = mock_bot_instance
+def test_create_telegram_bot(mock_bot_class):
+    assert create_telegram_bot("test_token") is mock_bot_class.return_value
+    assert mock_bot_class.call_args.kwargs["token"] == "test_token"
+    assert isinstance(mock_bot_class.call_args.kwargs["request"], HTTPXRequest)
 
-    processor = SondeProcessor(MOCK_URL)
-    test_file_path = "gpx/test_file.gpx"
 
-    with patch("builtins.open", mock_open(read_data="gpx content")):
-        await processor.send_to_telegram(test_file_path)
-        mock_bot_class.assert_called_once_with(token="test_token")
-        mock_bot_instance.send_document.assert_called_once()
+# Tests for Config
+def test_config_from_env(mock_env_vars):
+    config = Config.from_env()
+    assert config.bot_token == "test_token"
+    assert config.chat_id == "12345"
+    assert config.telegram_enabled
+
+
+def test_config_from_env_missing_vars():
+    with patch.dict(os.environ, {}, clear=True):
+        config = Config.from_env()
+    assert config.bot_token is None
+    assert config.chat_id is None
+    assert not config.telegram_enabled
 
 
 # Test for main function (integration-like test)
 @pytest.mark.asyncio
 @patch("main.parse_arguments")
-@patch.object(SondeProcessor, "fetch_website_content", return_value=MOCK_HTML_CONTENT)
+@patch.object(SondeProcessor, "fetch_website_content", new_callable=AsyncMock, return_value=MOCK_HTML_CONTENT)
 @patch.object(SondeProcessor, "get_coordinates")
-@patch.object(SondeProcessor, "create_gpx_file", return_value="gpx/test_file.gpx")
+@patch.object(SondeProcessor, "create_gpx_file", return_value=("test_file.gpx", b"<gpx>test</gpx>"))
 @patch.object(SondeProcessor, "send_to_telegram", new_callable=AsyncMock)
 async def test_main_function_success(
     mock_send_to_telegram,
@@ -411,9 +778,10 @@ async def test_main_function_success(
     mock_get_coordinates,
     mock_fetch_website_content,
     mock_parse_arguments,
+    mock_bot_class,
     mock_env_vars,
 ):
-    mock_parse_arguments.return_value = argparse.Namespace(url=MOCK_URL, coords=None)
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
     mock_get_coordinates.return_value = (
         SondeData(
             last_seen_coords=Coordinates(lat=50.0, lon=10.0),
@@ -436,12 +804,14 @@ async def test_main_function_success(
     mock_fetch_website_content.assert_called_once()
     mock_get_coordinates.assert_called_once()
     mock_create_gpx_file.assert_called_once()
-    mock_send_to_telegram.assert_called_once_with("gpx/test_file.gpx")
+    mock_send_to_telegram.assert_called_once_with(
+        mock_bot_class.return_value, "test_file.gpx", b"<gpx>test</gpx>"
+    )
 
 
 @pytest.mark.asyncio
 @patch("main.parse_arguments")
-@patch.object(SondeProcessor, "fetch_website_content", return_value=None)
+@patch.object(SondeProcessor, "fetch_website_content", new_callable=AsyncMock, return_value=None)
 @patch.object(SondeProcessor, "get_coordinates")
 @patch.object(SondeProcessor, "create_gpx_file")
 @patch.object(SondeProcessor, "send_to_telegram", new_callable=AsyncMock)
@@ -451,9 +821,10 @@ async def test_main_function_fetch_fails(
     mock_get_coordinates,
     mock_fetch_website_content,
     mock_parse_arguments,
+    mock_bot_class,
     mock_env_vars,
 ):
-    mock_parse_arguments.return_value = argparse.Namespace(url=MOCK_URL, coords=None)
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
 
     from main import main
 
@@ -468,7 +839,7 @@ async def test_main_function_fetch_fails(
 
 @pytest.mark.asyncio
 @patch("main.parse_arguments")
-@patch.object(SondeProcessor, "fetch_website_content", return_value=MOCK_HTML_CONTENT)
+@patch.object(SondeProcessor, "fetch_website_content", new_callable=AsyncMock, return_value=MOCK_HTML_CONTENT)
 @patch.object(SondeProcessor, "get_coordinates", return_value=(None, None, 0.0, 0.0))
 @patch.object(SondeProcessor, "create_gpx_file")
 @patch.object(SondeProcessor, "send_to_telegram", new_callable=AsyncMock)
@@ -478,9 +849,10 @@ async def test_main_function_get_coordinates_fails(
     mock_get_coordinates,
     mock_fetch_website_content,
     mock_parse_arguments,
+    mock_bot_class,
     mock_env_vars,
 ):
-    mock_parse_arguments.return_value = argparse.Namespace(url=MOCK_URL, coords=None)
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
 
     from main import main
 
@@ -495,19 +867,87 @@ async def test_main_function_get_coordinates_fails(
 
 @pytest.mark.asyncio
 @patch("main.parse_arguments")
-@patch.object(SondeProcessor, "fetch_website_content", return_value=MOCK_HTML_CONTENT)
+@patch.object(SondeProcessor, "run", new_callable=AsyncMock)
+async def test_main_function_telegram_start_fails(
+    mock_run,
+    mock_parse_arguments,
+    mock_bot_class,
+    mock_env_vars,
+):
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
+    mock_bot_class.return_value.initialize.side_effect = telegram.error.NetworkError("Telegram down")
+
+    from main import main
+
+    await main()
+
+    mock_run.assert_awaited_once()
+    assert mock_run.call_args.args[1] is None
+    mock_bot_class.return_value.shutdown.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "send_to_telegram", new_callable=AsyncMock)
+async def test_main_function_mixed_good_and_bad_urls(
+    mock_send_to_telegram,
+    mock_parse_arguments,
+    mock_bot_class,
+    mock_env_vars,
+):
+    bad_url = "http://[::1/x?sondenumber=S1"
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[bad_url, MOCK_URL], coords=None, save_gpx=False)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=MOCK_HTML_CONTENT))
+
+    from main import main
+
+    with patch("main.create_http_client", return_value=httpx.AsyncClient(transport=transport)):
+        await main()
+
+    mock_send_to_telegram.assert_awaited_once()
+    assert mock_send_to_telegram.call_args.args[1].startswith("S123456_")
+
+
+@pytest.mark.asyncio
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "run", new_callable=AsyncMock)
+async def test_main_function_isolates_failing_sonde(
+    mock_run,
+    mock_parse_arguments,
+    mock_bot_class,
+    mock_env_vars,
+):
+    mock_parse_arguments.return_value = argparse.Namespace(
+        urls=[MOCK_URL, MOCK_URL_2], coords=None, save_gpx=False
+    )
+    mock_run.side_effect = [RuntimeError("boom"), "S654321_gpx_waypoint.gpx"]
+
+    from main import main
+
+    await main()
+
+    assert mock_run.await_count == 2
+    mock_bot_class.return_value.shutdown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("os.makedirs")
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "fetch_website_content", new_callable=AsyncMock, return_value=MOCK_HTML_CONTENT)
 @patch.object(SondeProcessor, "get_coordinates")
-@patch.object(SondeProcessor, "create_gpx_file", return_value=None)
+@patch.object(SondeProcessor, "write_gpx_file", return_value=None)
 @patch.object(SondeProcessor, "send_to_telegram", new_callable=AsyncMock)
-async def test_main_function_create_gpx_file_fails(
+async def test_main_function_write_gpx_file_fails(
     mock_send_to_telegram,
-    mock_create_gpx_file,
+    mock_write_gpx_file,
     mock_get_coordinates,
     mock_fetch_website_content,
     mock_parse_arguments,
+    mock_makedirs,
+    mock_bot_class,
     mock_env_vars,
 ):
-    mock_parse_arguments.return_value = argparse.Namespace(url=MOCK_URL, coords=None)
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=True)
     mock_get_coordinates.return_value = (
         SondeData(
             last_seen_coords=Coordinates(lat=50.0, lon=10.0),
@@ -529,7 +969,7 @@ async def test_main_function_create_gpx_file_fails(
     mock_parse_arguments.assert_called_once()
     mock_fetch_website_content.assert_called_once()
     mock_get_coordinates.assert_called_once()
-    mock_create_gpx_file.assert_called_once()
+    mock_write_gpx_file.assert_called_once()
     mock_send_to_telegram.assert_not_called()
 
 
@@ -541,7 +981,7 @@ async def test_main_function_no_sonde_number(
     mock_parse_arguments,
     mock_env_vars,
 ):
-    mock_parse_arguments.return_value = argparse.Namespace(url=MOCK_URL, coords=None)
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
 
     from main import main
 
@@ -551,3 +991,70 @@ async def test_main_function_no_sonde_number(
     mock_extract_sonde_number.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "run", new_callable=AsyncMock)
+async def test_main_function_multiple_urls(
+    mock_run,
+    mock_parse_arguments,
+    mock_bot_class,
+    mock_env_vars,
+):
+    mock_parse_arguments.return_value = argparse.Namespace(
+        urls=[MOCK_URL, MOCK_URL_2], coords=None, save_gpx=False
+    )
+
+    from main import main
+
+    await main()
+
+    assert mock_run.call_count == 2
+    mock_bot_class.assert_called_once()
+    assert mock_bot_class.call_args.kwargs["token"] == "test_token"
+    bots = {call.args[1] for call in mock_run.call_args_list}
+    assert bots == {mock_bot_class.return_value}
+    mock_bot_class.return_value.initialize.assert_awaited_once()
+    mock_bot_class.return_value.shutdown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("os.makedirs")
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "run", new_callable=AsyncMock)
+async def test_main_function_save_gpx_creates_output_dir(
+    mock_run,
+    mock_parse_arguments,
+    mock_makedirs,
+    mock_bot_class,
+    mock_env_vars,
+):
+    mock_parse_arguments.return_value = argparse.Namespace(
+        urls=[MOCK_URL, MOCK_URL_2], coords=None, save_gpx=True
+    )
+
+    from main import main
+
+    await main()
+
+    mock_makedirs.assert_called_once_with("gpx", exist_ok=True)
+    assert mock_run.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("main.parse_arguments")
+@patch.object(SondeProcessor, "run", new_callable=AsyncMock)
+async def test_main_function_without_telegram_credentials(
+    mock_run,
+    mock_parse_arguments,
+    mock_bot_class,
+):
+    mock_parse_arguments.return_value = argparse.Namespace(urls=[MOCK_URL], coords=None, save_gpx=False)
+
+    from main import main
+
+    with patch("main.load_dotenv"), patch.dict(os.environ, {}, clear=True):
+        await main()
+
+    mock_bot_class.assert_not_called()
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[1] is None
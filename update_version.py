@@ -1,32 +1,44 @@
-import toml
-import sys
 import os
+import re
+import sys
+
+PROJECT_SECTION_RE = re.compile(r"^\[project\][ \t]*$(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+VERSION_RE = re.compile(r'^(version\s*=\s*)"([^"]*)"', re.MULTILINE)
+
 
 def update_pyproject_version(new_version: str):
     pyproject_path = os.path.join(os.path.dirname(__file__), "pyproject.toml")
-    
+
     try:
         with open(pyproject_path, "r") as f:
-            data = toml.load(f)
+            text = f.read()
     except FileNotFoundError:
         print(f"Error: pyproject.toml not found at {pyproject_path}")
         sys.exit(1)
-    except Exception as e:
+    except OSError as e:
         print(f"Error reading pyproject.toml: {e}")
         sys.exit(1)
 
-    if "project" not in data or "version" not in data["project"]:
+    # Rewrite only the version line of the [project] table so comments and
+    # formatting elsewhere in the file are preserved.
+    section_match = PROJECT_SECTION_RE.search(text)
+    version_match = section_match and VERSION_RE.search(text, *section_match.span(1))
+    if not version_match:
         print("Error: 'project' or 'version' key not found in pyproject.toml")
         sys.exit(1)
 
-    old_version = data["project"]["version"]
-    data["project"]["version"] = new_version
+    old_version = version_match.group(2)
+    text = (
+        text[: version_match.start()]
+        + f'{version_match.group(1)}"{new_version}"'
+        + text[version_match.end() :]
+    )
 
     try:
         with open(pyproject_path, "w") as f:
-            toml.dump(data, f)
+            f.write(text)
         print(f"Successfully updated pyproject.toml version from {old_version} to {new_version}")
-    except Exception as e:
+    except OSError as e:
         print(f"Error writing to pyproject.toml: {e}")
         sys.exit(1)
 